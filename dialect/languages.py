@@ -2,11 +2,14 @@
 # Copyright 2021-2022 Rafael Mardojai CM
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+from functools import lru_cache
+
 from gi.repository import Gio, GObject
 
 from dialect.define import LANGUAGES
 
 
+@lru_cache(maxsize=2048)
 def get_lang_name(code):
     name = LANGUAGES.get(code)
     if name:
@@ -15,12 +15,11 @@ try:
     gi.require_version('Adw', '1')
     gi.require_version('Soup', '3.0')
 
-    from gi.repository import Adw, Gio, GLib, Gst, Gtk
+    from gi.repository import Adw, Gio, GLib, Gtk
 except ImportError or ValueError:
     logging.error('Error: GObject dependencies not met.')
 
 from dialect.define import APP_ID, RES_PATH, VERSION
-from dialect.preferences import DialectPreferencesWindow
 from dialect.settings import Settings
 from dialect.window import DialectWindow
 
@@ -92,11 +91,6 @@ class Dialect(Adw.Application):
 
         return 0
 
-    def do_startup(self):
-        Adw.Application.do_startup(self)
-
-        Gst.init(None)  # Init Gst
-
     def process_command_line(self):
         if not self.argv:
             return
@@ -127,6 +121,9 @@ class Dialect(Adw.Application):
     def setup_actions(self):
         """ Setup menu actions """
 
+        # The action only writes the setting, the action state and UI are updated from the settings change.
+        # GSettings only emits changed for keys read after connecting, so connect before reading the initial state.
+        Settings.get().connect('changed::show-pronunciation', self._on_pronunciation_changed)
         pronunciation = Gio.SimpleAction.new_stateful(
             'pronunciation', None, Settings.get().show_pronunciation_value
         )
@@ -163,10 +160,18 @@ class Dialect(Adw.Application):
         self.set_accels_for_action('win.listen-src', ['<Primary><Shift>L'])
         self.set_accels_for_action('win.show-help-overlay', ['<Primary>question'])
 
-    def _on_pronunciation(self, action, value):
+    def _on_pronunciation(self, _action, value):
         """ Update show pronunciation setting """
-        action.props.state = value
-        Settings.get().show_pronunciation = value
+        Settings.get().show_pronunciation = value.get_boolean()
+
+    def _on_pronunciation_changed(self, settings, key):
+        """ Called on Settings::changed::show-pronunciation signal """
+        self.lookup_action('pronunciation').set_state(settings.get_value(key))
+
+        if self.window is None:
+            return
+
+        value = settings.get_boolean(key)
 
         # Update UI
         if self.window.trans_src_pron is not None:
@@ -176,6 +181,8 @@ class Dialect(Adw.Application):
 
     def _on_preferences(self, _action, _param):
         """ Show preferences window """
+        from dialect.preferences import DialectPreferencesWindow  # Only needed here, keep it out of startup
+
         window = DialectPreferencesWindow(self.window)
         window.props.transient_for = self.window
         window.present()
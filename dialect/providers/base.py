@@ -3,17 +3,39 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import io
+import logging
+import time
 import urllib.parse
-from dataclasses import dataclass
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
 from enum import Enum, Flag, auto
+from functools import cached_property, lru_cache
 from typing import Callable, Optional
 
-from gi.repository import Gio
+from gi.repository import Gio, GLib
 
-from dialect.define import APP_ID, LANG_ALIASES
+from dialect.define import APP_ID, LANG_ALIASES, TRANS_NUMBER
 from dialect.languages import get_lang_name
 
 
+@lru_cache(maxsize=1024)
+def _format_lang_code(code: str) -> str:
+    """Format a lang code following `BaseProvider.normalize_lang_code` criteria, without mapping aliases."""
+    code = code.replace('_', '-').lower()  # Normalize separator
+    codes = code.split('-')
+
+    if len(codes) == 2:  # Code contain a script or country code
+        if len(codes[1]) == 4:  # ISO 15924 (script)
+            codes[1] = codes[1].capitalize()
+
+        elif len(codes[1]) == 2:  # ISO 3166-1 (country)
+            codes[1] = codes[1].upper()
+
+        code = '-'.join(codes)
+
+    return code
+
+
 class ProviderCapability(Flag):
     TRANSLATION = auto()
     """ If it provides translation """
@@ -73,6 +95,22 @@ class Translation:
     pronunciation: tuple[Optional[str], Optional[str]] = (None, None)
 
 
+@dataclass
+class _Batch:
+    """Translations sharing the same languages sent together with `BaseProvider.translate_many`"""
+    src: str
+    dest: str
+    items: list[tuple[str, Callable, Callable]]
+    """ Texts to translate, as (text, on_done, on_fail) """
+    pending: set[int] = field(init=False)
+    """ Indexes of the items not finished yet """
+    retried: bool = False
+    """ If the items were already retried text by text after a batch failure """
+
+    def __post_init__(self):
+        self.pending = set(range(len(self.items)))
+
+
 class BaseProvider:
     name = ''
     """ Module name for code use, like settings storing """
@@ -91,6 +129,17 @@ class BaseProvider:
     }
     """ Default provider settings """
 
+    _CACHE_MAX = 512
+    """ Max number of translations kept in the cache """
+    _CACHE_MAX_CHARS = 1_000_000
+    """ Max number of characters, of source and translated texts, kept in the cache """
+    _CACHE_TTL = 3600
+    """ Seconds a cached translation is considered valid """
+    _BATCH_DELAY = 25
+    """ Milliseconds to wait for more translations before flushing the batch queue """
+    _BATCH_MAX_INFLIGHT = 4
+    """ Max number of batches being translated at the same time """
+
     def __init__(self):
         self.languages = []
         """ Languages available for translating """
@@ -104,11 +153,29 @@ class BaseProvider:
         self.chars_limit = -1
         """ Translation char limit """
 
-        self.history: list[Translation] = []
-        """ Here we save the translation history """
+        self.history: deque[Translation] = deque(maxlen=TRANS_NUMBER)
+        """ Here we save the translation history, newest first, oldest entries are dropped past TRANS_NUMBER """
+
+        self._trans_cache: OrderedDict[tuple[str, str, str], tuple[float, Translation]] = OrderedDict()
+        """ LRU cache of translations, mapping (src, dest, text) to (timestamp, translation) """
+        self._trans_cache_chars = 0
+        """ Number of characters currently kept in the translations cache """
+
+        self._batch_queue: list[tuple[str, str, str, Callable, Callable]] = []
+        """ Pending translations, as (text, src, dest, on_done, on_fail), waiting to be batched """
+        self._batch_timer = 0
+        """ Source id of the batch queue flush timeout, 0 if not armed """
+        self._batch_inflight = 0
+        """ Number of batches currently being translated """
+
+        self._inflight: dict[tuple[str, str, str], list[tuple[Callable, Callable]]] = {}
+        """ Callbacks waiting for a pending translation, mapped by (src, dest, text) """
 
         # GSettings
         self.settings = Gio.Settings(f'{APP_ID}.translator', f'/app/drey/Dialect/translators/{self.name}/')
+        self._settings_cache = {}
+        """ Local copy of read settings values, invalidated on settings changes """
+        self.settings.connect('changed', self._on_setting_changed)
 
     """
     Providers API methods
@@ -164,6 +231,28 @@ class BaseProvider:
         dest: str,
         on_done: Callable[[Translation], None],
         on_fail: Callable[[ProviderError], None],
+    ):
+        """
+        Translates text using the translations cache or the provider.
+
+        Providers should not override this method but `_translate_impl`.
+
+        Args:
+            text: The text to translate
+            src: The lang code of the source text
+            dest: The lang code to translate the text to
+            on_done: Called after the text was successfully translated
+            on_fail: Called after any error on translation
+        """
+        self._cached_translate(text, src, dest, on_done, on_fail)
+
+    def _translate_impl(
+        self,
+        text: str,
+        src: str,
+        dest: str,
+        on_done: Callable[[Translation], None],
+        on_fail: Callable[[ProviderError], None],
     ):
         """
         Translates text in the provider.
@@ -177,6 +266,29 @@ class BaseProvider:
         """
         raise NotImplementedError()
 
+    def translate_many(
+        self,
+        texts: list[str],
+        src: str,
+        dest: str,
+        on_done_list: list[Callable[[Translation], None]],
+        on_fail: Callable[[ProviderError], None],
+    ):
+        """
+        Translates several texts sharing the same languages at once.
+
+        Only providers with batch endpoints should override this method, translations are queued and sent with it
+        only if it's overridden. If on_fail is called the batch is retried text by text with `_translate_impl`.
+
+        Args:
+            texts: The texts to translate
+            src: The lang code of the source texts
+            dest: The lang code to translate the texts to
+            on_done_list: Called after each text was successfully translated, in the same order of texts
+            on_fail: Called after any error on translation
+        """
+        raise NotImplementedError()
+
     def suggest(
         self,
         text: str,
@@ -234,18 +346,44 @@ class BaseProvider:
         """
         return {}
 
+    @cached_property
+    def _alias_map(self) -> dict[str, str]:
+        """
+        Merge of `dialect.define.LANG_ALIASES` and `lang_aliases`, computed once per provider.
+
+        If `lang_aliases` ever changes at runtime, invalidate with `del self.__dict__['_alias_map']`.
+        """
+        return {**LANG_ALIASES, **self.lang_aliases}
+
     """
     Provider settings helpers and properties
     """
 
+    def _on_setting_changed(self, _settings, key):
+        self._settings_cache.pop(key, None)
+
+    def _get_setting(self, key: str, getter: Callable[[str], str | list[str]]) -> str | list[str]:
+        """
+        Get a settings value from the local cache, reading it from settings on first access.
+
+        Args:
+            key: Settings key to get
+            getter: Gio.Settings getter for the key type, e.g. `self.settings.get_string`
+        """
+        if key not in self._settings_cache:
+            self._settings_cache[key] = getter(key)
+        return self._settings_cache[key]
+
     @property
     def instance_url(self):
         """Instance url saved on settings."""
-        return self.settings.get_string('instance-url') or self.defaults['instance_url']
+        return self._get_setting('instance-url', self.settings.get_string) or self.defaults['instance_url']
 
     @instance_url.setter
     def instance_url(self, url):
         self.settings.set_string('instance-url', url)
+        self._settings_cache['instance-url'] = url
+        self.clear_trans_cache()
 
     def reset_instance_url(self):
         """Resets saved instance url."""
@@ -254,11 +392,13 @@ class BaseProvider:
     @property
     def api_key(self):
         """API key saved on settings."""
-        return self.settings.get_string('api-key') or self.defaults['api_key']
+        return self._get_setting('api-key', self.settings.get_string) or self.defaults['api_key']
 
     @api_key.setter
     def api_key(self, api_key):
         self.settings.set_string('api-key', api_key)
+        self._settings_cache['api-key'] = api_key
+        self.clear_trans_cache()
 
     def reset_api_key(self):
         """Resets saved API key."""
@@ -267,11 +407,13 @@ class BaseProvider:
     @property
     def src_langs(self):
         """Saved recent source langs of the user."""
-        return self.settings.get_strv('src-langs') or self.defaults['src_langs']
+        # Return a copy, callers modify the list before saving it back
+        return list(self._get_setting('src-langs', self.settings.get_strv) or self.defaults['src_langs'])
 
     @src_langs.setter
     def src_langs(self, src_langs):
         self.settings.set_strv('src-langs', src_langs)
+        self._settings_cache['src-langs'] = list(src_langs)
 
     def reset_src_langs(self):
         """Reset saved recent user source langs"""
@@ -280,11 +422,13 @@ class BaseProvider:
     @property
     def dest_langs(self):
         """Saved recent destination langs of the user."""
-        return self.settings.get_strv('dest-langs') or self.defaults['dest_langs']
+        # Return a copy, callers modify the list before saving it back
+        return list(self._get_setting('dest-langs', self.settings.get_strv) or self.defaults['dest_langs'])
 
     @dest_langs.setter
     def dest_langs(self, dest_langs):
         self.settings.set_strv('dest-langs', dest_langs)
+        self._settings_cache['dest-langs'] = list(dest_langs)
 
     def reset_dest_langs(self):
         """Reset saved recent user destination langs"""
@@ -294,8 +438,212 @@ class BaseProvider:
     General provider helpers
     """
 
+    def _cached_translate(
+        self,
+        text: str,
+        src: str,
+        dest: str,
+        on_done: Callable[[Translation], None],
+        on_fail: Callable[[ProviderError], None],
+    ):
+        """
+        Look up a translation in the cache, calling `_translate_impl` on misses.
+
+        Identical translations requested while one is pending are attached to it instead of being sent again.
+
+        Cache hits are deferred to the main loop so callers always get an async response.
+
+        The cache, the pending translations and the batch queue are not thread-safe, `_translate_impl` must call
+        its callbacks from the main loop.
+        """
+        key = (src, dest, text)
+
+        cached = self._trans_cache.get(key)
+        if cached is not None:
+            timestamp, translation = cached
+            if time.monotonic() - timestamp < self._CACHE_TTL:
+                self._trans_cache.move_to_end(key)
+                GLib.idle_add(self._deliver, on_done, translation)
+                return
+            self._uncache_translation(key)
+
+        if key in self._inflight:
+            self._inflight[key].append((on_done, on_fail))
+            return
+        self._inflight[key] = [(on_done, on_fail)]
+
+        def pop_inflight() -> list[tuple[Callable, Callable]]:
+            return self._inflight.pop(key, [])
+
+        def on_translated(translation: Translation):
+            callbacks = pop_inflight()
+
+            self._cache_translation(key, translation)
+
+            for callback, _on_fail in callbacks:
+                callback(translation)
+
+        def on_failed(error: ProviderError):
+            for _on_done, callback in pop_inflight():
+                callback(error)
+
+        try:
+            self._enqueue_translate(text, src, dest, on_translated, on_failed)
+        except Exception as exc:
+            # Never leave a pending entry behind, later identical requests would wait on it forever
+            logging.warning(exc)
+            on_failed(ProviderError(ProviderErrorCode.UNEXPECTED, str(exc)))
+
     @staticmethod
-    def format_url(url: str, path: str = '', params: dict = {}, http: bool = False):
+    def _deliver(callback: Callable, result: Translation | ProviderError):
+        """Call a translate callback from `GLib.idle_add`, removing the source whatever the callback returns."""
+        callback(result)
+        return GLib.SOURCE_REMOVE
+
+    def _enqueue_translate(
+        self,
+        text: str,
+        src: str,
+        dest: str,
+        on_done: Callable[[Translation], None],
+        on_fail: Callable[[ProviderError], None],
+    ):
+        """
+        Add a translation to the batch queue and arm the flush timeout.
+
+        If the provider has no batch implementation the translation is sent right away, there's nothing to
+        coalesce it with.
+        """
+        if not self._supports_batch:
+            self._safe_translate_impl(text, src, dest, on_done, on_fail)
+            return
+
+        self._batch_queue.append((text, src, dest, on_done, on_fail))
+        self._arm_batch_timer()
+
+    def _safe_translate_impl(
+        self,
+        text: str,
+        src: str,
+        dest: str,
+        on_done: Callable[[Translation], None],
+        on_fail: Callable[[ProviderError], None],
+    ):
+        """Call `_translate_impl`, passing errors raised before the request is sent to on_fail."""
+        try:
+            self._translate_impl(text, src, dest, on_done, on_fail)
+        except Exception as exc:
+            logging.warning(exc)
+            on_fail(ProviderError(ProviderErrorCode.UNEXPECTED, str(exc)))
+
+    @property
+    def _supports_batch(self) -> bool:
+        """If the provider overrides `translate_many` with a real batch implementation"""
+        return type(self).translate_many is not BaseProvider.translate_many
+
+    def _arm_batch_timer(self):
+        if not self._batch_timer:
+            self._batch_timer = GLib.timeout_add(self._BATCH_DELAY, self._flush_batch)
+
+    def _flush_batch(self):
+        """
+        Dispatch queued translations grouped by (src, dest).
+
+        Groups exceeding `_BATCH_MAX_INFLIGHT` are kept queued until a running batch finishes.
+        """
+        self._batch_timer = 0
+
+        groups: dict[tuple[str, str], list[tuple[str, Callable, Callable]]] = {}
+        for text, src, dest, on_done, on_fail in self._batch_queue:
+            groups.setdefault((src, dest), []).append((text, on_done, on_fail))
+        self._batch_queue = []
+
+        for (src, dest), items in groups.items():
+            if self._batch_inflight < self._BATCH_MAX_INFLIGHT:
+                self._dispatch_batch(_Batch(src, dest, items))
+            else:
+                self._batch_queue.extend((text, src, dest, on_done, on_fail) for text, on_done, on_fail in items)
+
+        return GLib.SOURCE_REMOVE
+
+    def _dispatch_batch(self, batch: _Batch):
+        self._batch_inflight += 1
+
+        if len(batch.items) == 1:
+            self._translate_batch_singles(batch)
+            return
+
+        try:
+            self.translate_many(
+                [text for text, _on_done, _on_fail in batch.items],
+                batch.src,
+                batch.dest,
+                [
+                    self._batch_item_callback(batch, index, on_done)
+                    for index, (_text, on_done, _on_fail) in enumerate(batch.items)
+                ],
+                lambda error: self._on_batch_fail(batch, error),
+            )
+        except Exception as exc:
+            self._on_batch_fail(batch, ProviderError(ProviderErrorCode.UNEXPECTED, str(exc)))
+
+    def _batch_item_callback(self, batch: _Batch, index: int, callback: Callable) -> Callable:
+        """Wrap an item callback so it's called once and frees the batch slot when the last item finishes."""
+        def wrapper(result: Translation | ProviderError):
+            if index not in batch.pending:
+                return
+
+            batch.pending.discard(index)
+            if not batch.pending:
+                self._batch_inflight -= 1
+                if self._batch_queue:
+                    self._arm_batch_timer()
+
+            callback(result)
+
+        return wrapper
+
+    def _on_batch_fail(self, batch: _Batch, error: ProviderError):
+        if batch.retried:
+            return
+
+        batch.retried = True
+        logging.warning(f'Batch translation failed, retrying text by text: {error.message}')
+        self._translate_batch_singles(batch)
+
+    def _translate_batch_singles(self, batch: _Batch):
+        for index in sorted(batch.pending):
+            text, on_done, on_fail = batch.items[index]
+            self._safe_translate_impl(
+                text,
+                batch.src,
+                batch.dest,
+                self._batch_item_callback(batch, index, on_done),
+                self._batch_item_callback(batch, index, on_fail),
+            )
+
+    def _cache_translation(self, key: tuple[str, str, str], translation: Translation):
+        """Add a translation to the cache, dropping the least recently used ones past the cache limits."""
+        self._uncache_translation(key)
+        self._trans_cache[key] = (time.monotonic(), translation)
+        self._trans_cache_chars += len(key[2]) + len(translation.text)
+
+        while len(self._trans_cache) > self._CACHE_MAX or self._trans_cache_chars > self._CACHE_MAX_CHARS:
+            self._uncache_translation(next(iter(self._trans_cache)))
+
+    def _uncache_translation(self, key: tuple[str, str, str]):
+        """Remove a translation from the cache if present."""
+        cached = self._trans_cache.pop(key, None)
+        if cached is not None:
+            self._trans_cache_chars -= len(key[2]) + len(cached[1].text)
+
+    def clear_trans_cache(self):
+        """Drop all cached translations."""
+        self._trans_cache.clear()
+        self._trans_cache_chars = 0
+
+    @staticmethod
+    def format_url(url: str, path: str = '', params: dict | None = None, http: bool = False):
         """
         Compose a HTTP url with the given pieces.
 
@@ -310,15 +658,10 @@ class BaseProvider:
         if not path.startswith('/'):
             path = '/' + path
 
-        protocol = 'https://'
-        if url.startswith('localhost:') or http:
-            protocol = 'http://'
+        scheme = 'http' if http or url.startswith('localhost:') else 'https'
+        query = urllib.parse.urlencode(params) if params else ''
 
-        params_str = urllib.parse.urlencode(params)
-        if params_str:
-            params_str = '?' + params_str
-
-        return protocol + url + path + params_str
+        return urllib.parse.urlunsplit((scheme, url, path, query, ''))
 
     def normalize_lang_code(self, code: str):
         """
@@ -336,23 +679,8 @@ class BaseProvider:
         Args:
             code: Language ISO code
         """
-        code = code.replace('_', '-').lower()  # Normalize separator
-        codes = code.split('-')
-
-        if len(codes) == 2:  # Code contain a script or country code
-            if len(codes[1]) == 4:  # ISO 15924 (script)
-                codes[1] = codes[1].capitalize()
-
-            elif len(codes[1]) == 2:  # ISO 3166-1 (country)
-                codes[1] = codes[1].upper()
-
-            code = '-'.join(codes)
-
-        aliases = {**LANG_ALIASES, **self.lang_aliases}
-        if code in aliases:
-            code = aliases[code]
-
-        return code
+        code = _format_lang_code(code)
+        return self._alias_map.get(code, code)
 
     def cmp_langs(self, a: str, b: str) -> bool:
         """
@@ -389,13 +717,13 @@ class BaseProvider:
         if tts:  # Add lang to supported TTS languages list
             self.tts_languages.append(code)
 
-        if code != original_code and code not in self._nonstandard_langs:
+        if code != original_code:
             # Save a divergent lang code for later denormalization
-            self._nonstandard_langs[code] = original_code
+            self._nonstandard_langs.setdefault(code, original_code)
 
-        if name is not None and code not in self._languages_names:
+        if name is not None:
             # Save name provider by the service
-            self._languages_names[code] = name
+            self._languages_names.setdefault(code, name)
 
     def denormalize_lang(self, *codes: str) -> str | tuple[str]:
         """
@@ -103,7 +103,7 @@ class Provider(SoupProvider):
         # Do async request
         self.send_and_read_and_process_response(message, on_response, on_fail, json=False)
 
-    def translate(self, text, src, dest, on_done, on_fail):
+    def _translate_impl(self, text, src, dest, on_done, on_fail):
         def on_response(data):
             try:
                 data = data[0]
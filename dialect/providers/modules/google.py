@@ -409,7 +409,7 @@ class Provider(LocalProvider, SoupProvider):
 
         return self.format_url(url, params=params)
 
-    def translate(self, text, src_lang, dest_lang, on_done, on_fail):
+    def _translate_impl(self, text, src_lang, dest_lang, on_done, on_fail):
         def on_response(data):
             try:
                 token_found = False
@@ -145,7 +145,7 @@ class Provider(SoupProvider):
         # Do async request
         self.send_and_read_and_process_response(message, on_response, on_fail)
 
-    def translate(self, text, src, dest, on_done, on_fail):
+    def _translate_impl(self, text, src, dest, on_done, on_fail):
         def on_response(data):
             detected = data.get('detectedLanguage', {}).get('language', None)
             translation = Translation(data['translatedText'], (text, src, dest), detected)
@@ -165,6 +165,32 @@ class Provider(SoupProvider):
         # Do async request
         self.send_and_read_and_process_response(message, on_response, on_fail)
 
+    def translate_many(self, texts, src, dest, on_done_list, on_fail):
+        def on_response(data):
+            translations = data['translatedText']
+            detected = data.get('detectedLanguage', [{}] * len(texts))
+
+            if len(translations) != len(texts):
+                on_fail(ProviderError(ProviderErrorCode.UNEXPECTED, 'Batch response size mismatch'))
+                return
+
+            for text, translated, detection, on_done in zip(texts, translations, detected, on_done_list):
+                on_done(Translation(translated, (text, src, dest), detection.get('language', None)))
+
+        # Request body, LT accepts a list of texts sharing the same languages
+        data = {
+            'q': texts,
+            'source': src,
+            'target': dest,
+        }
+        if self.api_key and ProviderFeature.API_KEY in self.features:
+            data['api_key'] = self.api_key
+
+        # Request message
+        message = self.create_message('POST', self.translate_url, data)
+        # Do async request
+        self.send_and_read_and_process_response(message, on_response, on_fail)
+
     def suggest(self, text, src, dest, suggestion, on_done, on_fail):
         def on_response(data):
             on_done(data.get('success', False))
@@ -86,7 +86,7 @@ class Provider(SoupProvider):
     def init_tts(self, on_done, on_fail):
         self.init(on_done, on_fail)
 
-    def translate(self, text, src, dest, on_done, on_fail):
+    def _translate_impl(self, text, src, dest, on_done, on_fail):
         def on_response(data):
             try:
                 detected = data.get('info', {}).get('detectedSource', None)
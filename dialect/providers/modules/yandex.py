@@ -149,7 +149,7 @@ class Provider(SoupProvider):
         path = f'/api/v1/tr.json/translate?id={self._uuid}-0-0&srv=android'
         return self.format_url('translate.yandex.net', path)
 
-    def translate(self, text, src, dest, on_done, on_fail):
+    def _translate_impl(self, text, src, dest, on_done, on_fail):
         def on_response(data):
             detected = None
             if 'code' in data and data['code'] == 200:
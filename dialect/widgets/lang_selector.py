@@ -2,11 +2,10 @@
 # Copyright 2020-2022 Rafael Mardojai CM
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-import re
-
 from gi.repository import Adw, Gdk, GObject, Gtk
 
 from dialect.define import RES_PATH
+from dialect.languages import LangObject
 
 
 @Gtk.Template(resource_path=f'{RES_PATH}/lang-selector.ui')
@@ -49,9 +48,10 @@ class LangSelector(Adw.Bin):
 
         self.recent_model.connect('items-changed', self._on_recent_changed)
 
-        self.filter = Gtk.CustomFilter()
-        self.filter.set_filter_func(self._filter_langs)
-        sorter = Gtk.CustomSorter.new(self._sort_langs)
+        # Filter and sort by lang name in GTK instead of calling back into Python per row
+        name_expression = Gtk.PropertyExpression.new(LangObject, None, 'name')
+        self.filter = Gtk.StringFilter.new(name_expression)
+        sorter = Gtk.StringSorter.new(name_expression)
         sorted_model = Gtk.SortListModel.new(model=self.model, sorter=sorter)
         filter_model = Gtk.FilterListModel.new(sorted_model, self.filter)
         self.lang_list.bind_model(filter_model, self._create_lang_row)
@@ -108,15 +108,6 @@ class LangSelector(Adw.Bin):
     def _create_lang_row(self, lang):
         return LangRow(lang)
 
-    def _filter_langs(self, item):
-        search = self.search.get_text()
-        return bool(re.search(search, item.name, re.IGNORECASE))
-
-    def _sort_langs(self, lang_a, lang_b, _data):
-        a = lang_a.name.lower()
-        b = lang_b.name.lower()
-        return (a > b) - (a < b)
-
     @Gtk.Template.Callback()
     def _on_search(self, _entry):
         """ Called on self.search::changed signal """
@@ -125,7 +116,7 @@ class LangSelector(Adw.Bin):
         else:
             self.revealer.props.reveal_child = True
 
-        self.filter.emit('changed', Gtk.FilterChange.DIFFERENT)
+        self.filter.props.search = self.search.props.text
 
     @Gtk.Template.Callback()
     def _on_search_activate(self, _entry):
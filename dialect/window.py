@@ -107,11 +107,8 @@ class DialectWindow(Adw.ApplicationWindow):
         # Application object
         self.app = kwargs['application']
 
-        # GStreamer playbin object and related setup
-        self.player = Gst.ElementFactory.make('playbin', 'player')
-        bus = self.player.get_bus()
-        bus.add_signal_watch()
-        bus.connect('message', self.on_gst_message)
+        # GStreamer playbin object, created on first playback by _ensure_player
+        self.player = None
 
         # Setup window
         self.setup_actions()
@@ -692,12 +689,12 @@ class DialectWindow(Adw.ApplicationWindow):
 
     def add_history_entry(self, translation: Translation):
         """Add a history entry to the history list."""
+        history = self.provider['trans'].history
         if self.current_history > 0:
-            del self.provider['trans'].history[: self.current_history]
+            for _ in range(self.current_history):
+                history.popleft()
             self.current_history = 0
-        if len(self.provider['trans'].history) == TRANS_NUMBER:
-            self.provider['trans'].history.pop()
-        self.provider['trans'].history.insert(0, translation)
+        history.appendleft(translation)  # The oldest entry is dropped if history is full
         GLib.idle_add(self.reset_return_forward_btns)
 
     def switch_all(self, src_language, dest_language, src_text, dest_text):
@@ -891,7 +888,22 @@ class DialectWindow(Adw.ApplicationWindow):
             self.toggle_voice_spinner(False)
             self.voice_loading = False
 
+    def _ensure_player(self):
+        """ Init GStreamer and setup the playbin object if not done yet """
+        if self.player is not None:
+            return
+
+        if not Gst.is_initialized():
+            Gst.init(None)
+
+        self.player = Gst.ElementFactory.make('playbin', 'player')
+        bus = self.player.get_bus()
+        bus.add_signal_watch()
+        bus.connect('message', self.on_gst_message)
+
     def _play_audio(self, path):
+        self._ensure_player()
+
         uri = 'file://' + path
         self.player.set_property('uri', uri)
         self.player.set_state(Gst.State.PLAYING)